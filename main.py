@@ -1,8 +1,12 @@
 from fastapi import FastAPI, HTTPException
-import json
+import asyncio
+import contextlib
+import orjson
+import os
+import threading
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 app = FastAPI(title="Bots Dashboard API", version="1.0.0")
 
@@ -56,47 +60,191 @@ class InfrastructureRequest(BaseModel):
     resourceGroup: str
     components: dict
 
+    @field_validator("components")
+    @classmethod
+    def check_components_serializable(cls, components: dict) -> dict:
+        # orjson cannot store integers beyond 64 bits; reject them here
+        # instead of failing later when the file is saved
+        try:
+            orjson.dumps(components)
+        except orjson.JSONEncodeError as e:
+            raise ValueError(str(e))
+        return components
+
 class CompleteOnboardingRequest(BaseModel):
     applicationName: str
     devops: DevOpsRequest
     infrastructure: List[InfrastructureRequest]
 
-def load_json_file(filename: str):
+class AppIndex:
+    """Application records of one list, keyed by id and by applicationName."""
+
+    def __init__(self, apps: list):
+        self.by_id = {}
+        self.by_name = {}
+        for app in apps:
+            self.add(app)
+
+    def add(self, app: dict):
+        # First record wins, matching the order a linear scan would find them in
+        self.by_id.setdefault(app.get("id"), app)
+        self.by_name.setdefault(app.get("applicationName"), app)
+
+class InfraIndex:
+    """Per-environment AppIndexes plus a reverse index {id or name: {environment: app}}."""
+
+    def __init__(self, environments: dict):
+        self.environments = {}
+        self.environment_names = list(environments)
+        self.by_app = {}
+        for env_name, env_apps in environments.items():
+            self.environments[env_name] = AppIndex([])
+            for app in env_apps:
+                self.add(env_name, app)
+
+    def add(self, env_name: str, app: dict):
+        self.environments[env_name].add(app)
+        for key in (app.get("id"), app.get("applicationName")):
+            self.by_app.setdefault(key, {}).setdefault(env_name, app)
+
+def build_index(data: dict):
+    # infrastructure_details.json is split per environment, the others hold one list
+    if "environments" in data:
+        return InfraIndex(data["environments"])
+    return AppIndex(data["applications"])
+
+class JsonStore:
+    """A parsed JSON file together with the lookup index built from it."""
+
+    def __init__(self, mtime_ns: int, data: dict):
+        self.mtime_ns = mtime_ns
+        self.data = data
+        self.index = build_index(data)
+
+# Parsed JSON files keyed by filename. An entry is reused as long as the
+# file's mtime on disk is unchanged. The cached data and index are shared
+# by all requests and never modified in place.
+_JSON_CACHE = {}
+
+# Held by the write routes across load, check, change and save, so
+# concurrent writers cannot interleave or lose each other's records.
+_JSON_WRITE_LOCK = threading.Lock()
+
+def load_json_store(filename: str) -> JsonStore:
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        mtime_ns = os.stat(filename).st_mtime_ns
+        store = _JSON_CACHE.get(filename)
+        if store and store.mtime_ns == mtime_ns:
+            return store
+        with open(filename, 'rb') as f:
+            data = orjson.loads(f.read())
+        store = _JSON_CACHE[filename] = JsonStore(mtime_ns, data)
+        return store
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in {filename}")
 
-def find_app_by_id_or_name(data: list, identifier: str):
-    for app in data:
-        if app.get("id") == identifier or app.get("applicationName") == identifier:
-            return app
+def get_fresh_json_store(filename: str) -> Optional[JsonStore]:
+    # The cached store if the file is unchanged on disk, without reading it
+    store = _JSON_CACHE.get(filename)
+    try:
+        if store and store.mtime_ns == os.stat(filename).st_mtime_ns:
+            return store
+    except FileNotFoundError:
+        pass
     return None
 
+def copy_json_data(data: dict) -> dict:
+    # Writers append to a copy of the record lists and publish it through
+    # save_json_file, so readers never see records that were not saved.
+    # The records themselves are not modified and stay shared.
+    if "environments" in data:
+        return {**data, "environments": {env_name: list(env_apps) for env_name, env_apps in data["environments"].items()}}
+    return {**data, "applications": list(data["applications"])}
+
+def find_app_by_id_or_name(index: AppIndex, identifier: str):
+    return index.by_id.get(identifier) or index.by_name.get(identifier)
+
+def app_exists(index: AppIndex, identifier: str) -> bool:
+    return identifier in index.by_id or identifier in index.by_name
+
+def write_temp_file(filename: str, buf: bytes):
+    # Write and fsync buf to a sibling of filename; callers rename it into place
+    with open(filename + ".tmp", 'wb') as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
+
 def save_json_file(filename: str, data: dict):
+    save_json_files({filename: data})
+
+def save_json_files(files: dict):
+    # Every file is first written to a temporary sibling and only renamed into
+    # place once all of them were written, so a crash never leaves a target
+    # truncated. With several files, their current contents are kept in
+    # memory so that if one rename fails, the renames already done can be
+    # undone. Callers hold _JSON_WRITE_LOCK.
+    previous = {}
+    replaced = []
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        for filename, data in files.items():
+            # Serialize up front and write the whole buffer in a single call
+            write_temp_file(filename, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        if len(files) > 1:
+            for filename in files:
+                previous[filename] = None
+                if os.path.exists(filename):
+                    with open(filename, 'rb') as f:
+                        previous[filename] = f.read()
+        for filename in files:
+            os.replace(filename + ".tmp", filename)
+            replaced.append(filename)
+        for filename, data in files.items():
+            _JSON_CACHE[filename] = JsonStore(os.stat(filename).st_mtime_ns, data)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error saving {filename}: {str(e)}")
+        # Best effort: a failed restore must not hide the original error.
+        # Restored files get a new mtime, so the cache re-reads them.
+        for filename in replaced:
+            if filename not in previous:
+                continue
+            with contextlib.suppress(OSError):
+                if previous[filename] is None:
+                    os.remove(filename)
+                else:
+                    write_temp_file(filename, previous[filename])
+                    os.replace(filename + ".tmp", filename)
+        for filename in files:
+            with contextlib.suppress(OSError):
+                os.remove(filename + ".tmp")
+        raise HTTPException(status_code=500, detail=f"Error saving {', '.join(files)}: {str(e)}")
 
-def generate_next_id(applications: list) -> str:
-    if not applications:
-        return "app-001"
-    
+def find_max_app_id(applications: list) -> int:
     max_id = 0
     for app in applications:
-        if app.get("id", "").startswith("app-"):
+        app_id = app.get("id", "")
+        if app_id[:4] == "app-":
             try:
-                num = int(app["id"].split("-")[1])
+                num = int(app_id[4:])
                 max_id = max(max_id, num)
-            except (ValueError, IndexError):
+            except ValueError:
                 continue
     
-    return f"app-{max_id + 1:03d}"
+    return max_id
+
+def generate_next_id(data: dict, index: AppIndex) -> str:
+    # The counter is persisted as a top-level "_next_id" key of
+    # application_details.json; scan the ids only if it is missing.
+    if "_next_id" not in data:
+        data["_next_id"] = find_max_app_id(data["applications"]) + 1
+    
+    # Skip ids already taken, e.g. by records added to the file by hand
+    next_id = data["_next_id"]
+    while f"app-{next_id:03d}" in index.by_id:
+        next_id += 1
+    
+    data["_next_id"] = next_id + 1
+    return f"app-{next_id:03d}"
 
 @app.get("/")
 def read_root():
@@ -105,14 +253,13 @@ def read_root():
 # List all applications
 @app.get("/applications")
 def list_applications():
-    data = load_json_file("application_details.json")
-    return data["applications"]
+    return load_json_store("application_details.json").data["applications"]
 
 # Get application details by ID or name
 @app.get("/applications/{identifier}")
 def get_application_details(identifier: str):
-    data = load_json_file("application_details.json")
-    app = find_app_by_id_or_name(data["applications"], identifier)
+    store = load_json_store("application_details.json")
+    app = find_app_by_id_or_name(store.index, identifier)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     return app
@@ -120,35 +267,25 @@ def get_application_details(identifier: str):
 # Onboard new application
 @app.post("/applications")
 def create_application(app_request: ApplicationRequest):
-    data = load_json_file("application_details.json")
-    
-    # Check if application already exists
-    existing_app = find_app_by_id_or_name(data["applications"], app_request.applicationName)
-    if existing_app:
-        raise HTTPException(status_code=409, detail=f"Application '{app_request.applicationName}' already exists")
-    
-    # Generate new ID
-    new_id = generate_next_id(data["applications"])
-    
-    # Create new application
-    new_app = {
-        "id": new_id,
-        "applicationName": app_request.applicationName,
-        "displayName": app_request.displayName,
-        "type": app_request.type,
-        "description": app_request.description,
-        "version": app_request.version,
-        "status": app_request.status,
-        "owner": app_request.owner,
-        "maintainer": app_request.maintainer,
-        "tags": app_request.tags
-    }
-    
-    # Add to applications list
-    data["applications"].append(new_app)
-    
-    # Save updated data
-    save_json_file("application_details.json", data)
+    with _JSON_WRITE_LOCK:
+        store = load_json_store("application_details.json")
+        data = copy_json_data(store.data)
+        
+        # Check if application already exists
+        if app_exists(store.index, app_request.applicationName):
+            raise HTTPException(status_code=409, detail=f"Application '{app_request.applicationName}' already exists")
+        
+        # Generate new ID
+        new_id = generate_next_id(data, store.index)
+        
+        # Create new application
+        new_app = {"id": new_id, **app_request.model_dump()}
+        
+        # Add to applications list
+        data["applications"].append(new_app)
+        
+        # Save updated data
+        save_json_file("application_details.json", data)
     
     return {
         "message": "Application created successfully",
@@ -158,8 +295,8 @@ def create_application(app_request: ApplicationRequest):
 # Get DevOps details by ID or name
 @app.get("/devops/{identifier}")
 def get_devops_details(identifier: str):
-    data = load_json_file("devops_details.json")
-    app = find_app_by_id_or_name(data["applications"], identifier)
+    store = load_json_store("devops_details.json")
+    app = find_app_by_id_or_name(store.index, identifier)
     if not app:
         raise HTTPException(status_code=404, detail="DevOps details not found")
     return app
@@ -167,35 +304,29 @@ def get_devops_details(identifier: str):
 # Onboard DevOps details
 @app.post("/devops")
 def create_devops_details(devops_request: DevOpsRequest):
-    # Verify application exists
-    app_data = load_json_file("application_details.json")
-    app = find_app_by_id_or_name(app_data["applications"], devops_request.applicationName)
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    # Load DevOps data
-    devops_data = load_json_file("devops_details.json")
-    
-    # Check if DevOps details already exist
-    existing_devops = find_app_by_id_or_name(devops_data["applications"], devops_request.applicationName)
-    if existing_devops:
-        raise HTTPException(status_code=409, detail=f"DevOps details for '{devops_request.applicationName}' already exist")
-    
-    # Create new DevOps entry
-    new_devops = {
-        "id": app["id"],
-        "applicationName": devops_request.applicationName,
-        "repositoryUrl": devops_request.repositoryUrl,
-        "cicdPipeline": devops_request.cicdPipeline.dict(),
-        "codeQuality": devops_request.codeQuality.dict(),
-        "monitoring": devops_request.monitoring.dict()
-    }
-    
-    # Add to DevOps list
-    devops_data["applications"].append(new_devops)
-    
-    # Save updated data
-    save_json_file("devops_details.json", devops_data)
+    with _JSON_WRITE_LOCK:
+        # Verify application exists
+        app_store = load_json_store("application_details.json")
+        app = find_app_by_id_or_name(app_store.index, devops_request.applicationName)
+        if not app:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        # Load DevOps data
+        devops_store = load_json_store("devops_details.json")
+        devops_data = copy_json_data(devops_store.data)
+        
+        # Check if DevOps details already exist
+        if app_exists(devops_store.index, app["id"]):
+            raise HTTPException(status_code=409, detail=f"DevOps details for '{devops_request.applicationName}' already exist")
+        
+        # Create new DevOps entry
+        new_devops = {"id": app["id"], **devops_request.model_dump()}
+        
+        # Add to DevOps list
+        devops_data["applications"].append(new_devops)
+        
+        # Save updated data
+        save_json_file("devops_details.json", devops_data)
     
     return {
         "message": "DevOps details created successfully",
@@ -205,39 +336,33 @@ def create_devops_details(devops_request: DevOpsRequest):
 # Onboard Infrastructure details
 @app.post("/infrastructure")
 def create_infrastructure_details(infra_request: InfrastructureRequest):
-    # Verify application exists
-    app_data = load_json_file("application_details.json")
-    app = find_app_by_id_or_name(app_data["applications"], infra_request.applicationName)
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    # Load Infrastructure data
-    infra_data = load_json_file("infrastructure_details.json")
-    
-    # Validate environment
-    if infra_request.environment not in infra_data["environments"]:
-        raise HTTPException(status_code=400, detail=f"Invalid environment '{infra_request.environment}'. Valid environments: {list(infra_data['environments'].keys())}")
-    
-    # Check if infrastructure already exists for this app in this environment
-    existing_infra = find_app_by_id_or_name(infra_data["environments"][infra_request.environment], infra_request.applicationName)
-    if existing_infra:
-        raise HTTPException(status_code=409, detail=f"Infrastructure details for '{infra_request.applicationName}' in '{infra_request.environment}' already exist")
-    
-    # Create new Infrastructure entry
-    new_infra = {
-        "id": app["id"],
-        "applicationName": infra_request.applicationName,
-        "cloud": infra_request.cloud,
-        "region": infra_request.region,
-        "resourceGroup": infra_request.resourceGroup,
-        "components": infra_request.components
-    }
-    
-    # Add to Infrastructure list for the specified environment
-    infra_data["environments"][infra_request.environment].append(new_infra)
-    
-    # Save updated data
-    save_json_file("infrastructure_details.json", infra_data)
+    with _JSON_WRITE_LOCK:
+        # Verify application exists
+        app_store = load_json_store("application_details.json")
+        app = find_app_by_id_or_name(app_store.index, infra_request.applicationName)
+        if not app:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        # Load Infrastructure data
+        infra_store = load_json_store("infrastructure_details.json")
+        infra_data = copy_json_data(infra_store.data)
+        
+        # Validate environment
+        if infra_request.environment not in infra_store.index.environments:
+            raise HTTPException(status_code=400, detail=f"Invalid environment '{infra_request.environment}'. Valid environments: {infra_store.index.environment_names}")
+        
+        # Check if infrastructure already exists for this app in this environment
+        if app_exists(infra_store.index.environments[infra_request.environment], app["id"]):
+            raise HTTPException(status_code=409, detail=f"Infrastructure details for '{infra_request.applicationName}' in '{infra_request.environment}' already exist")
+        
+        # Create new Infrastructure entry
+        new_infra = {"id": app["id"], **infra_request.model_dump(exclude={"environment"})}
+        
+        # Add to Infrastructure list for the specified environment
+        infra_data["environments"][infra_request.environment].append(new_infra)
+        
+        # Save updated data
+        save_json_file("infrastructure_details.json", infra_data)
     
     return {
         "message": f"Infrastructure details created successfully for {infra_request.environment} environment",
@@ -247,84 +372,83 @@ def create_infrastructure_details(infra_request: InfrastructureRequest):
 # Onboard DevOps and Infrastructure details for an application
 @app.post("/onboard/{application_name}")
 def onboard_application_details(application_name: str, devops_request: DevOpsRequest, infrastructure_requests: List[InfrastructureRequest]):
-    # Verify application exists
-    app_data = load_json_file("application_details.json")
-    app = find_app_by_id_or_name(app_data["applications"], application_name)
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    results = {"devops": None, "infrastructure": []}
-    
-    # Onboard DevOps details
-    try:
-        devops_data = load_json_file("devops_details.json")
-        existing_devops = find_app_by_id_or_name(devops_data["applications"], application_name)
+    with _JSON_WRITE_LOCK:
+        app_store = load_json_store("application_details.json")
+        devops_store = load_json_store("devops_details.json")
+        infra_store = load_json_store("infrastructure_details.json")
+        devops_data = copy_json_data(devops_store.data)
+        infra_data = copy_json_data(infra_store.data)
         
-        if existing_devops:
-            results["devops"] = {"status": "exists", "message": "DevOps details already exist"}
-        else:
-            new_devops = {
-                "id": app["id"],
-                "applicationName": application_name,
-                "repositoryUrl": devops_request.repositoryUrl,
-                "cicdPipeline": devops_request.cicdPipeline.dict(),
-                "codeQuality": devops_request.codeQuality.dict(),
-                "monitoring": devops_request.monitoring.dict()
-            }
-            devops_data["applications"].append(new_devops)
-            save_json_file("devops_details.json", devops_data)
-            results["devops"] = {"status": "created", "data": new_devops}
-    except Exception as e:
-        results["devops"] = {"status": "error", "message": str(e)}
-    
-    # Onboard Infrastructure details for each environment
-    infra_data = load_json_file("infrastructure_details.json")
-    
-    for infra_request in infrastructure_requests:
+        # Verify application exists
+        app = find_app_by_id_or_name(app_store.index, application_name)
+        if not app:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        results = {"devops": None, "infrastructure": []}
+        # Files changed by this request, written together at the end
+        pending_saves = {}
+        
+        # Onboard DevOps details
         try:
-            if infra_request.environment not in infra_data["environments"]:
-                results["infrastructure"].append({
-                    "environment": infra_request.environment,
-                    "status": "error",
-                    "message": f"Invalid environment '{infra_request.environment}'"
-                })
-                continue
-            
-            existing_infra = find_app_by_id_or_name(infra_data["environments"][infra_request.environment], application_name)
-            
-            if existing_infra:
-                results["infrastructure"].append({
-                    "environment": infra_request.environment,
-                    "status": "exists",
-                    "message": "Infrastructure details already exist"
-                })
+            if app_exists(devops_store.index, app["id"]):
+                results["devops"] = {"status": "exists", "message": "DevOps details already exist"}
             else:
-                new_infra = {
+                new_devops = {
                     "id": app["id"],
                     "applicationName": application_name,
-                    "cloud": infra_request.cloud,
-                    "region": infra_request.region,
-                    "resourceGroup": infra_request.resourceGroup,
-                    "components": infra_request.components
+                    **devops_request.model_dump(exclude={"applicationName"})
                 }
-                infra_data["environments"][infra_request.environment].append(new_infra)
+                devops_data["applications"].append(new_devops)
+                pending_saves["devops_details.json"] = devops_data
+                results["devops"] = {"status": "created", "data": new_devops}
+        except Exception as e:
+            results["devops"] = {"status": "error", "message": str(e)}
+        
+        # Onboard Infrastructure details for each environment
+        # Environments onboarded earlier in this request; the store's index
+        # only covers what has been saved
+        created_environments = set()
+        
+        for infra_request in infrastructure_requests:
+            try:
+                if infra_request.environment not in infra_store.index.environments:
+                    results["infrastructure"].append({
+                        "environment": infra_request.environment,
+                        "status": "error",
+                        "message": f"Invalid environment '{infra_request.environment}'"
+                    })
+                    continue
+                
+                if app_exists(infra_store.index.environments[infra_request.environment], app["id"]) or infra_request.environment in created_environments:
+                    results["infrastructure"].append({
+                        "environment": infra_request.environment,
+                        "status": "exists",
+                        "message": "Infrastructure details already exist"
+                    })
+                else:
+                    new_infra = {
+                        "id": app["id"],
+                        "applicationName": application_name,
+                        **infra_request.model_dump(exclude={"applicationName", "environment"})
+                    }
+                    infra_data["environments"][infra_request.environment].append(new_infra)
+                    created_environments.add(infra_request.environment)
+                    pending_saves["infrastructure_details.json"] = infra_data
+                    results["infrastructure"].append({
+                        "environment": infra_request.environment,
+                        "status": "created",
+                        "data": new_infra
+                    })
+            except Exception as e:
                 results["infrastructure"].append({
                     "environment": infra_request.environment,
-                    "status": "created",
-                    "data": new_infra
+                    "status": "error",
+                    "message": str(e)
                 })
-        except Exception as e:
-            results["infrastructure"].append({
-                "environment": infra_request.environment,
-                "status": "error",
-                "message": str(e)
-            })
-    
-    # Save infrastructure changes
-    try:
-        save_json_file("infrastructure_details.json", infra_data)
-    except Exception as e:
-        return {"message": "Partial success - DevOps saved but infrastructure save failed", "error": str(e), "results": results}
+        
+        # Save DevOps and infrastructure changes in one go
+        if pending_saves:
+            save_json_files(pending_saves)
     
     return {
         "message": "Application onboarding completed",
@@ -335,19 +459,13 @@ def onboard_application_details(application_name: str, devops_request: DevOpsReq
 # List all DevOps configurations
 # @app.get("/devops")
 # def list_devops():
-#     data = load_json_file("devops_details.json")
-#     return data["applications"]
+#     return load_json_store("devops_details.json").data["applications"]
 
 # Get infrastructure details by app name/ID across all environments
 @app.get("/infrastructure/{identifier}")
 def get_app_infrastructure_all_environments(identifier: str):
-    data = load_json_file("infrastructure_details.json")
-    result = {}
-    
-    for env_name, env_apps in data["environments"].items():
-        app = find_app_by_id_or_name(env_apps, identifier)
-        if app:
-            result[env_name] = app
+    store = load_json_store("infrastructure_details.json")
+    result = store.index.by_app.get(identifier)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Infrastructure details not found for '{identifier}'")
@@ -360,11 +478,11 @@ def get_app_infrastructure_all_environments(identifier: str):
 # Get infrastructure details by ID or name and environment
 # @app.get("/infrastructure/{environment}/{identifier}")
 # def get_infrastructure_details(environment: str, identifier: str):
-#     data = load_json_file("infrastructure_details.json")
-#     if environment not in data["environments"]:
+#     store = load_json_store("infrastructure_details.json")
+#     if environment not in store.index.environments:
 #         raise HTTPException(status_code=404, detail=f"Environment '{environment}' not found")
     
-#     app = find_app_by_id_or_name(data["environments"][environment], identifier)
+#     app = find_app_by_id_or_name(store.index.environments[environment], identifier)
 #     if not app:
 #         raise HTTPException(status_code=404, detail=f"Infrastructure details not found for '{identifier}' in '{environment}'")
 #     return app
@@ -372,35 +490,43 @@ def get_app_infrastructure_all_environments(identifier: str):
 # List infrastructure for specific environment
 # @app.get("/infrastructure/{environment}")
 # def list_infrastructure_by_environment(environment: str):
-#     data = load_json_file("infrastructure_details.json")
-#     if environment not in data["environments"]:
+#     store = load_json_store("infrastructure_details.json")
+#     if environment not in store.index.environments:
 #         raise HTTPException(status_code=404, detail=f"Environment '{environment}' not found")
-#     return data["environments"][environment]
+#     return store.data["environments"][environment]
 
 # List all environments
 # @app.get("/infrastructure")
 # def list_all_infrastructure():
-#     data = load_json_file("infrastructure_details.json")
-#     return data["environments"]
+#     return load_json_store("infrastructure_details.json").data["environments"]
 
 # Get complete application profile (all details combined)
 @app.get("/profile/{identifier}")
-def get_complete_profile(identifier: str, environment: Optional[str] = "production"):
+async def get_complete_profile(identifier: str, environment: Optional[str] = "production"):
+    # Cached files are served inline; only files that changed on disk are
+    # loaded, concurrently, on the default thread pool
+    stores = {filename: get_fresh_json_store(filename) for filename in ("application_details.json", "devops_details.json", "infrastructure_details.json")}
+    misses = [filename for filename, store in stores.items() if store is None]
+    if misses:
+        loop = asyncio.get_running_loop()
+        loaded = await asyncio.gather(*(loop.run_in_executor(None, load_json_store, filename) for filename in misses))
+        stores.update(zip(misses, loaded))
+    app_store = stores["application_details.json"]
+    devops_store = stores["devops_details.json"]
+    infra_store = stores["infrastructure_details.json"]
+    
     # Get application details
-    app_data = load_json_file("application_details.json")
-    app_details = find_app_by_id_or_name(app_data["applications"], identifier)
+    app_details = find_app_by_id_or_name(app_store.index, identifier)
     if not app_details:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Get DevOps details
-    devops_data = load_json_file("devops_details.json")
-    devops_details = find_app_by_id_or_name(devops_data["applications"], identifier)
+    devops_details = find_app_by_id_or_name(devops_store.index, identifier)
     
     # Get infrastructure details
-    infra_data = load_json_file("infrastructure_details.json")
     infra_details = None
-    if environment in infra_data["environments"]:
-        infra_details = find_app_by_id_or_name(infra_data["environments"][environment], identifier)
+    if environment in infra_store.index.environments:
+        infra_details = find_app_by_id_or_name(infra_store.index.environments[environment], identifier)
     
     return {
         "application": app_details,
@@ -409,3 +535,10 @@ def get_complete_profile(identifier: str, environment: Optional[str] = "producti
         "environment": environment
     }
 
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvicorn picks uvloop and httptools on its own when they are installed
+    # (uvicorn[standard]). _JSON_WRITE_LOCK only serializes writers within
+    # one process, so extra workers are opt-in.
+    uvicorn.run("main:app", workers=int(os.environ.get("WEB_CONCURRENCY", 1)))